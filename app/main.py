@@ -124,6 +124,7 @@ def api_current_data():
         'success': True,
         'weight': coins_data.get('total_weight', 0),
         'coins_data': coins_data,
+        'recent': coin_tracker.history.summary(),
         'goals': goals
     })
 
@@ -230,6 +231,7 @@ def telegram_status():
 def simulate_weight(weight):
     old_weight = coin_tracker.current_weight
     coin_tracker.current_weight = weight
+    coin_tracker.history.append(weight)
     if weight < old_weight:
         drop = old_weight - weight
         print(f"Simulated weight drop: {old_weight:.3f}g → {weight:.3f}g (-{drop:.3f}g)")
@@ -246,7 +248,8 @@ def debug_weight():
         'current_weight': coin_tracker.current_weight,
         'connected': coin_tracker.connected,
         'port': coin_tracker.port,
-        'coins_data': coin_tracker.calculate_rs2_coins()
+        'coins_data': coin_tracker.calculate_rs2_coins(),
+        'recent': coin_tracker.history.summary()
     })
 
 @app.route('/arduino/test')
@@ -3,6 +3,7 @@ import serial.tools.list_ports
 import time
 from .database import save_weight
 from .telegram_alerts import telegram_bot
+from .weight_history import WeightHistory
 
 class CoinTracker:
     def __init__(self):
@@ -11,6 +12,7 @@ class CoinTracker:
         self.connected = False
         self.port = None
         self.last_stable_weight = 0.0
+        self.history = WeightHistory()  # Recent samples for short-window queries
         
     def find_arduino_port(self):
         """Try to find Arduino port automatically"""
@@ -87,6 +89,7 @@ class CoinTracker:
                 if weight is not None:
                     weight = round(weight, 3)
                     old_weight = self.current_weight
+                    self.history.append(weight)
                     
                     # Only update if weight changed significantly
                     if abs(weight - old_weight) > 0.001:
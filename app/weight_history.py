@@ -0,0 +1,177 @@
+import threading
+import time
+from array import array
+from collections import deque
+
+
+class WeightHistory:
+    """Fixed-size in-memory ring of (timestamp, weight) samples.
+
+    Storage is two preallocated array('d') buffers, so memory never grows
+    past `capacity` samples. Min/max/mean over the last `window_seconds`
+    are kept up to date on every append with monotonic deques and a
+    running sum, so reading them never touches the database. All access
+    goes through a lock since the serial thread and Flask requests share
+    one instance.
+
+    Default timestamps come from time.monotonic() so a wall-clock step
+    (e.g. an NTP correction) can never leave samples stuck in the window.
+    """
+
+    __slots__ = (
+        'capacity', 'window_seconds', '_timestamps', '_weights',
+        '_count', '_start', '_sum', '_min_idx', '_max_idx', '_lock',
+    )
+
+    def __init__(self, capacity=4096, window_seconds=60.0):
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._weights = array('d', bytes(8 * capacity))
+        self._count = 0   # total samples ever appended
+        self._start = 0   # first sample (absolute index) inside the window
+        self._sum = 0.0   # sum of weights inside the window
+        self._min_idx = deque()  # absolute indexes, weights increasing
+        self._max_idx = deque()  # absolute indexes, weights decreasing
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of samples held in the ring, including ones already expired
+        from the window; use window_count() for the window itself"""
+        return min(self._count, self.capacity)
+
+    def append(self, weight, timestamp=None):
+        """Record a sample in O(1) (amortised) and slide the window"""
+        with self._lock:
+            # Stamp inside the lock so concurrent appends stay in order
+            if timestamp is None:
+                timestamp = time.monotonic()
+            cap = self.capacity
+            idx = self._count
+            weights = self._weights
+
+            # The slot we are about to overwrite must leave the window first
+            if idx - self._start >= cap:
+                self._evict_oldest()
+
+            slot = idx % cap
+            self._timestamps[slot] = timestamp
+            weights[slot] = weight
+            self._count = idx + 1
+            self._sum += weight
+
+            min_idx = self._min_idx
+            while min_idx and weights[min_idx[-1] % cap] >= weight:
+                min_idx.pop()
+            min_idx.append(idx)
+
+            max_idx = self._max_idx
+            while max_idx and weights[max_idx[-1] % cap] <= weight:
+                max_idx.pop()
+            max_idx.append(idx)
+
+            self._expire(timestamp)
+
+    def _expire(self, now):
+        """Drop samples older than now - window_seconds (lock must be held)"""
+        cutoff = now - self.window_seconds
+        cap = self.capacity
+        while self._start < self._count and self._timestamps[self._start % cap] < cutoff:
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        """Move the window start forward by one sample (lock must be held)"""
+        start = self._start
+        self._sum -= self._weights[start % self.capacity]
+        if self._min_idx and self._min_idx[0] == start:
+            self._min_idx.popleft()
+        if self._max_idx and self._max_idx[0] == start:
+            self._max_idx.popleft()
+        self._start = start + 1
+        if self._start == self._count:
+            self._sum = 0.0  # Empty window: drop accumulated rounding error
+
+    def _stats(self, now):
+        """Expire old samples and return (count, min, max, mean)"""
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            count = self._count - self._start
+            if count <= 0:
+                return 0, None, None, None
+            cap = self.capacity
+            return (
+                count,
+                self._weights[self._min_idx[0] % cap],
+                self._weights[self._max_idx[0] % cap],
+                self._sum / count,
+            )
+
+    def window_count(self, now=None):
+        """Number of samples inside the window ending at now"""
+        return self._stats(now)[0]
+
+    def window_min(self, now=None):
+        """Lowest weight inside the window ending at now, or None"""
+        return self._stats(now)[1]
+
+    def window_max(self, now=None):
+        """Highest weight inside the window ending at now, or None"""
+        return self._stats(now)[2]
+
+    def window_mean(self, now=None):
+        """Mean weight inside the window ending at now, or None"""
+        return self._stats(now)[3]
+
+    def latest(self):
+        """Return the newest (timestamp, weight) pair, or None if empty"""
+        with self._lock:
+            if self._count == 0:
+                return None
+            slot = (self._count - 1) % self.capacity
+            return self._timestamps[slot], self._weights[slot]
+
+    def summary(self, now=None):
+        """Window statistics as a JSON-friendly dict"""
+        count, low, high, mean = self._stats(now)
+        return {
+            'window_seconds': self.window_seconds,
+            'samples': count,
+            'min': low,
+            'max': high,
+            'mean': round(mean, 3) if mean is not None else None,
+        }
+
+    def numpy_views(self, now=None):
+        """Return zero-copy NumPy views of the current window, oldest first.
+
+        The window may wrap around the end of the ring, so this returns a
+        list of up to two (timestamps, weights) segment pairs. The views
+        share memory with the ring and are only valid until the next
+        append, which may overwrite the slots they point at. They are
+        read-only, since writing through them would corrupt the window
+        stats.
+        """
+        import numpy as np
+
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            ts = np.frombuffer(self._timestamps, dtype=np.float64)
+            ws = np.frombuffer(self._weights, dtype=np.float64)
+            ts.flags.writeable = False
+            ws.flags.writeable = False
+            if self._count == self._start:
+                return []
+            first = self._start % self.capacity
+            last = self._count % self.capacity  # one past the newest slot
+            if first < last:
+                return [(ts[first:last], ws[first:last])]
+            segments = [(ts[first:], ws[first:])]
+            if last:
+                segments.append((ts[:last], ws[:last]))
+            return segments
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from app.weight_history import WeightHistory
+
+
+def test_summary_on_empty_history():
+    history = WeightHistory(capacity=4, window_seconds=60)
+    assert history.summary(now=0) == {
+        'window_seconds': 60,
+        'samples': 0,
+        'min': None,
+        'max': None,
+        'mean': None,
+    }
+    assert history.latest() is None
+
+
+def test_capacity_eviction_keeps_newest_samples():
+    history = WeightHistory(capacity=3, window_seconds=60)
+    for i, weight in enumerate([9.0, 1.0, 2.0, 3.0]):
+        history.append(weight, timestamp=i)
+
+    assert len(history) == 3
+    assert history.window_count(now=3) == 3
+    assert history.window_max(now=3) == 3.0
+    assert history.window_min(now=3) == 1.0
+    assert history.window_mean(now=3) == pytest.approx(2.0)
+    assert history.latest() == (3.0, 3.0)
+
+
+def test_time_eviction_on_append():
+    history = WeightHistory(capacity=10, window_seconds=5)
+    history.append(8.0, timestamp=0)
+    history.append(2.0, timestamp=3)
+    history.append(4.0, timestamp=7)
+
+    assert history.window_count(now=7) == 2
+    assert history.window_max(now=7) == 4.0
+    assert history.window_min(now=7) == 2.0
+
+
+def test_time_eviction_on_read_after_readings_stop():
+    history = WeightHistory(capacity=10, window_seconds=60)
+    history.append(5.0, timestamp=0)
+
+    assert history.summary(now=30)['samples'] == 1
+    summary = history.summary(now=3600)
+    assert summary['samples'] == 0
+    assert summary['max'] is None
+
+
+def test_equal_weights_tie_in_deques():
+    history = WeightHistory(capacity=10, window_seconds=5)
+    history.append(2.0, timestamp=0)
+    history.append(2.0, timestamp=1)
+    history.append(2.0, timestamp=2)
+
+    # Dropping the first tied sample must leave the others reported
+    assert history.window_count(now=5.5) == 2
+    assert history.window_min(now=5.5) == 2.0
+    assert history.window_max(now=5.5) == 2.0
+    assert history.window_mean(now=5.5) == pytest.approx(2.0)
+
+
+def _flatten(segments):
+    timestamps = np.concatenate([ts for ts, _ in segments])
+    weights = np.concatenate([ws for _, ws in segments])
+    return timestamps.tolist(), weights.tolist()
+
+
+def test_numpy_views_wrap_with_head_at_zero():
+    history = WeightHistory(capacity=3, window_seconds=60)
+    for i in range(6):
+        history.append(float(i), timestamp=i)
+
+    segments = history.numpy_views(now=5)
+    assert len(segments) == 1
+    assert _flatten(segments) == ([3.0, 4.0, 5.0], [3.0, 4.0, 5.0])
+
+
+def test_numpy_views_wrap_with_head_past_zero():
+    history = WeightHistory(capacity=3, window_seconds=60)
+    for i in range(5):
+        history.append(float(i), timestamp=i)
+
+    segments = history.numpy_views(now=4)
+    assert len(segments) == 2
+    assert _flatten(segments) == ([2.0, 3.0, 4.0], [2.0, 3.0, 4.0])
+
+
+def test_numpy_views_share_memory_and_cover_window_only():
+    history = WeightHistory(capacity=4, window_seconds=5)
+    for i in range(3):
+        history.append(float(i), timestamp=i * 3)
+
+    segments = history.numpy_views(now=6)
+    assert _flatten(segments) == ([3.0, 6.0], [1.0, 2.0])
+    assert not segments[0][1].flags.owndata
+    assert history.numpy_views(now=100) == []
+
+
+def test_numpy_views_are_read_only():
+    history = WeightHistory(capacity=4, window_seconds=60)
+    history.append(3.0, timestamp=0)
+    history.append(5.0, timestamp=1)
+
+    ts, ws = history.numpy_views(now=1)[0]
+    with pytest.raises(ValueError):
+        ws -= 1.0
+    with pytest.raises(ValueError):
+        ts[0] = 10.0
+    assert history.window_min(now=1) == 3.0
+    assert history.window_mean(now=1) == pytest.approx(4.0)
+
+
+def test_sum_resets_when_window_empties():
+    history = WeightHistory(capacity=10, window_seconds=1)
+    history.append(0.1, timestamp=0)
+    history.append(0.2, timestamp=0.5)
+    assert history.window_count(now=10) == 0
+
+    history.append(0.3, timestamp=10)
+    assert history.window_mean(now=10) == 0.3
+
+
+def test_default_timestamps_use_monotonic_clock(monkeypatch):
+    history = WeightHistory(capacity=10, window_seconds=60)
+    monkeypatch.setattr('app.weight_history.time.monotonic', lambda: 100.0)
+    monkeypatch.setattr('app.weight_history.time.time', lambda: 0.0)
+    history.append(2.0)
+    assert history.latest() == (100.0, 2.0)
+    assert history.window_count() == 1